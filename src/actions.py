@@ -38,7 +38,7 @@ class Observer(ops.Object):
             event: The event fired from get-admin-password action.
         """
         container = self.charm.unit.get_container(JENKINS_SERVICE_NAME)
-        if not jenkins.is_storage_ready(container):
+        if not self.jenkins.is_storage_ready(container):
             event.fail("Service not yet ready.")
             return
         credentials = jenkins.get_admin_credentials(container)
@@ -51,7 +51,7 @@ class Observer(ops.Object):
             event: The rotate credentials event.
         """
         container = self.charm.unit.get_container(JENKINS_SERVICE_NAME)
-        if not jenkins.is_storage_ready(container):
+        if not self.jenkins.is_storage_ready(container):
             event.fail("Service not yet ready.")
             return
         try:
@@ -2,13 +2,13 @@
 # See LICENSE file for licensing details.
 
 """The Jenkins agent relation observer."""
+import functools
 import ipaddress
 import logging
 import socket
 import typing
 
 import ops
-from charms.traefik_k8s.v2.ingress import IngressPerAppReadyEvent, IngressPerAppRevokedEvent
 
 import ingress
 import jenkins
@@ -51,7 +51,7 @@ class Observer(ops.Object):
         )
         charm.framework.observe(
             charm.on[DEPRECATED_AGENT_RELATION].relation_departed,
-            self._on_deprecated_agent_relation_departed,
+            self._on_agent_relation_departed,
         )
         charm.framework.observe(
             charm.on[AGENT_RELATION].relation_joined, self._on_agent_relation_joined
@@ -59,14 +59,14 @@ class Observer(ops.Object):
         charm.framework.observe(
             charm.on[AGENT_RELATION].relation_departed, self._on_agent_relation_departed
         )
-        # Event hooks for agent-discovery-ingress
+        # Event hooks for agent-discovery-ingress, both change the agent discovery url
         charm.framework.observe(
             ingress_observer.ingress.on.ready,
-            self._ingress_on_ready,
+            self.reconfigure_agent_discovery,
         )
         charm.framework.observe(
             ingress_observer.ingress.on.revoked,
-            self._ingress_on_revoked,
+            self.reconfigure_agent_discovery,
         )
 
     @property
@@ -100,7 +100,19 @@ class Observer(ops.Object):
                 )
 
         # Fallback to using socket.fqdn
-        return f"http://{socket.getfqdn()}:{jenkins.WEB_PORT}"
+        return f"http://{self._fqdn}:{jenkins.WEB_PORT}"
+
+    @functools.cached_property
+    def _fqdn(self) -> str:
+        """Get the unit's fully qualified domain name.
+
+        The reverse DNS lookup can block and its result does not change during the hook, hence
+        it is only resolved once.
+
+        Returns:
+            The fully qualified domain name.
+        """
+        return socket.getfqdn()
 
     def _on_deprecated_agent_relation_joined(self, event: ops.RelationJoinedEvent) -> None:
         """Handle deprecated agent relation joined event.
@@ -108,34 +120,7 @@ class Observer(ops.Object):
         Args:
             event: The event fired from an agent joining the relationship.
         """
-        container = self.charm.unit.get_container(JENKINS_SERVICE_NAME)
-        if not jenkins.is_storage_ready(container):
-            logger.warning("Service not yet ready. Deferring.")
-            event.defer()
-            return
-        # The relation is joined, it cannot be None, hence the type casting.
-        deprecated_agent_relation_meta = typing.cast(
-            typing.Mapping[str, AgentMeta], self.state.deprecated_agent_relation_meta
-        )
-        # The event unit cannot be None.
-        agent_meta = deprecated_agent_relation_meta[typing.cast(ops.Unit, event.unit).name]
-        if not agent_meta:
-            logger.warning("Relation data not ready yet. Deferring.")
-            # The event needs to be retried until the agents have set it's side of relation data.
-            event.defer()
-            return
-
-        self.charm.unit.status = ops.MaintenanceStatus("Adding agent node.")
-        try:
-            self.jenkins.add_agent_node(agent_meta=agent_meta, container=container)
-            secret = self.jenkins.get_node_secret(container=container, node_name=agent_meta.name)
-        except jenkins.JenkinsError as exc:
-            self.charm.unit.status = ops.BlockedStatus(f"Jenkins API exception. {exc=!r}")
-            return
-
-        jenkins_url = self.agent_discovery_url
-        event.relation.data[self.model.unit].update({"url": jenkins_url, "secret": secret})
-        self.charm.unit.status = ops.ActiveStatus()
+        self._add_agent_node(event, self.state.deprecated_agent_relation_meta, deprecated=True)
 
     def _on_agent_relation_joined(self, event: ops.RelationJoinedEvent) -> None:
         """Handle agent relation joined event.
@@ -143,15 +128,28 @@ class Observer(ops.Object):
         Args:
             event: The event fired from an agent joining the relationship.
         """
+        self._add_agent_node(event, self.state.agent_relation_meta, deprecated=False)
+
+    def _add_agent_node(
+        self,
+        event: ops.RelationJoinedEvent,
+        agent_relation_meta: typing.Optional[typing.Mapping[str, typing.Optional[AgentMeta]]],
+        deprecated: bool,
+    ) -> None:
+        """Register the joining agent on Jenkins and share the node secret with it.
+
+        Args:
+            event: The event fired from an agent joining the relationship.
+            agent_relation_meta: The metadata of the agents on the joined relation.
+            deprecated: Whether the agent joined through the deprecated agent relation.
+        """
         container = self.charm.unit.get_container(JENKINS_SERVICE_NAME)
-        if not jenkins.is_storage_ready(container):
+        if not self.jenkins.is_storage_ready(container):
             logger.warning("Service not yet ready. Deferring.")
             event.defer()
             return
         # The relation is joined, it cannot be None, hence the type casting.
-        agent_relation_meta = typing.cast(
-            typing.Mapping[str, AgentMeta], self.state.agent_relation_meta
-        )
+        agent_relation_meta = typing.cast(typing.Mapping[str, AgentMeta], agent_relation_meta)
         # The event unit cannot be None.
         agent_meta = agent_relation_meta[typing.cast(ops.Unit, event.unit).name]
         if not agent_meta:
@@ -162,56 +160,30 @@ class Observer(ops.Object):
 
         self.charm.unit.status = ops.MaintenanceStatus("Adding agent node.")
         try:
-            self.jenkins.wait_ready()
+            if not deprecated:
+                self.jenkins.wait_ready()
             self.jenkins.add_agent_node(agent_meta=agent_meta, container=container)
             secret = self.jenkins.get_node_secret(container=container, node_name=agent_meta.name)
         except jenkins.JenkinsError as exc:
             self.charm.unit.status = ops.BlockedStatus(f"Jenkins API exception. {exc=!r}")
             return
 
-        jenkins_url = self.agent_discovery_url
+        # The deprecated relation holds a single secret, the agent relation one per agent.
+        secret_key = "secret" if deprecated else f"{agent_meta.name}_secret"
         event.relation.data[self.model.unit].update(
-            {"url": jenkins_url, f"{agent_meta.name}_secret": secret}
+            {"url": self.agent_discovery_url, secret_key: secret}
         )
         self.charm.unit.status = ops.ActiveStatus()
 
-    def _on_deprecated_agent_relation_departed(self, event: ops.RelationDepartedEvent) -> None:
-        """Handle deprecated agent relation departed event.
-
-        Args:
-            event: The event fired when a unit in deprecated agent relation is departed.
-        """
-        # the event unit cannot be None.
-        container = self.charm.unit.get_container(JENKINS_SERVICE_NAME)
-        if not jenkins.is_storage_ready(container):
-            logger.warning("Relation departed before service ready.")
-            return
-
-        # The relation data is removed before this particular hook runs, making the name set by the
-        # agent not available. Hence, we can try to infer the name of the unit.
-        # See discussion: https://github.com/canonical/operator/issues/888
-        # assert type since event unit cannot be None.
-        agent_name = jenkins.get_agent_name(typing.cast(ops.Unit, event.unit).name)
-        self.charm.unit.status = ops.MaintenanceStatus("Removing agent node.")
-        try:
-            self.jenkins.remove_agent_node(agent_name=agent_name, container=container)
-        except jenkins.JenkinsError as exc:
-            logger.error("Failed to remove agent %s, %s", agent_name, exc)
-            # There is no support for degraded status yet, however, this will not impact Jenkins
-            # server operation.
-            self.charm.unit.status = ops.ActiveStatus(f"Failed to remove {agent_name}")
-            return
-        self.charm.unit.status = ops.ActiveStatus()
-
     def _on_agent_relation_departed(self, event: ops.RelationDepartedEvent) -> None:
-        """Handle agent relation departed event.
+        """Handle agent and deprecated agent relation departed event.
 
         Args:
             event: The event fired when a unit in agent relation is departed.
         """
         # the event unit cannot be None.
         container = self.charm.unit.get_container(JENKINS_SERVICE_NAME)
-        if not jenkins.is_storage_ready(container):
+        if not self.jenkins.is_storage_ready(container):
             logger.warning("Relation departed before service ready.")
             return
 
@@ -236,24 +208,11 @@ class Observer(ops.Object):
 
         Will cause agents to restart!!
         """
+        # Resolved once, the URL is the same for every agent relation.
+        agent_discovery_url = self.agent_discovery_url
+        unit = self.model.unit
         for relation in self.model.relations[AGENT_RELATION]:
-            relation_discovery_url = relation.data[self.model.unit].get("url")
-            if relation_discovery_url and relation_discovery_url == self.agent_discovery_url:
+            unit_data = relation.data[unit]
+            if unit_data.get("url") == agent_discovery_url:
                 continue
-            relation.data[self.model.unit].update({"url": self.agent_discovery_url})
-
-    def _ingress_on_ready(self, event: IngressPerAppReadyEvent) -> None:
-        """Handle ready event for agent-discovery-ingress.
-
-        Args:
-            event: The event fired.
-        """
-        self.reconfigure_agent_discovery(event)
-
-    def _ingress_on_revoked(self, event: IngressPerAppRevokedEvent) -> None:
-        """Handle revoked event for agent-discovery-ingress.
-
-        Args:
-            event: The event fired.
-        """
-        self.reconfigure_agent_discovery(event)
+            unit_data["url"] = agent_discovery_url
@@ -3,8 +3,9 @@
 
 """Observer module for Jenkins to auth_proxy integration."""
 
+import json
 import logging
-from typing import List
+from typing import Optional, Tuple
 
 import ops
 from charms.oathkeeper.v0.auth_proxy import AuthProxyConfig, AuthProxyRequirer
@@ -18,8 +19,8 @@ import jenkins
 import pebble
 from state import AUTH_PROXY_RELATION, JENKINS_SERVICE_NAME, State
 
-AUTH_PROXY_ALLOWED_ENDPOINTS: List[str] = []
-AUTH_PROXY_HEADERS = ["X-User"]
+AUTH_PROXY_ALLOWED_ENDPOINTS: Tuple[str, ...] = ()
+AUTH_PROXY_HEADERS: Tuple[str, ...] = ("X-User",)
 
 
 logger = logging.getLogger(__name__)
@@ -51,24 +52,15 @@ class Observer(ops.Object):
 
         self.auth_proxy = AuthProxyRequirer(self.charm)
 
-        self.charm.framework.observe(
-            self.charm.on[AUTH_PROXY_RELATION].relation_joined,
-            self._on_auth_proxy_relation_joined,
-        )
-        self.charm.framework.observe(
-            self.charm.on[AUTH_PROXY_RELATION].relation_departed,
-            self._auth_proxy_relation_departed,
-        )
+        framework = charm.framework
+        auth_proxy_events = charm.on[AUTH_PROXY_RELATION]
+        framework.observe(auth_proxy_events.relation_joined, self._on_auth_proxy_relation_joined)
+        framework.observe(auth_proxy_events.relation_departed, self._auth_proxy_relation_departed)
 
-        # Event hooks for agent-discovery-ingress
-        charm.framework.observe(
-            self.ingress.on.ready,
-            self._ingress_on_ready,
-        )
-        charm.framework.observe(
-            self.ingress.on.revoked,
-            self._ingress_on_revoked,
-        )
+        # Event hooks for ingress
+        ingress_events = self.ingress.on
+        framework.observe(ingress_events.ready, self._ingress_on_ready)
+        framework.observe(ingress_events.revoked, self._ingress_on_revoked)
 
     def _on_auth_proxy_relation_joined(self, event: ops.RelationCreatedEvent) -> None:
         """Configure the auth proxy.
@@ -77,12 +69,13 @@ class Observer(ops.Object):
             event: the event triggering the handler.
         """
         container = self.charm.unit.get_container(JENKINS_SERVICE_NAME)
-        if not jenkins.is_storage_ready(container) or not self.ingress.url:
+        ingress_url = self.ingress.url
+        if not self.jenkins.is_storage_ready(container) or not ingress_url:
             logger.warning("Service not yet ready. Deferring.")
             event.defer()
             return
 
-        self._update_auth_proxy_config()
+        self._update_auth_proxy_config(ingress_url)
         self._replan_jenkins(event)
 
     # pylint: disable=duplicate-code
@@ -94,21 +87,51 @@ class Observer(ops.Object):
             disable_security: Whether or not to replan with security disabled.
         """
         container = self.charm.unit.get_container(JENKINS_SERVICE_NAME)
-        if not jenkins.is_storage_ready(container):
+        if not self.jenkins.is_storage_ready(container):
             logger.warning("Service not yet ready. Deferring.")
             event.defer()
             return
         pebble.replan_jenkins(container, self.jenkins, self.state, disable_security)
 
-    def _update_auth_proxy_config(self) -> None:
-        """Update auth_proxy configuration with the correct jenkins url."""
+    def _update_auth_proxy_config(self, ingress_url: Optional[str]) -> None:
+        """Update auth_proxy configuration with the correct jenkins url.
+
+        Args:
+            ingress_url: the ingress URL Jenkins is exposed on.
+        """
         auth_proxy_config = AuthProxyConfig(
-            protected_urls=[self.ingress.url],
-            allowed_endpoints=AUTH_PROXY_ALLOWED_ENDPOINTS,
-            headers=AUTH_PROXY_HEADERS,
+            protected_urls=[ingress_url],
+            # The relation schema only accepts lists.
+            allowed_endpoints=list(AUTH_PROXY_ALLOWED_ENDPOINTS),
+            headers=list(AUTH_PROXY_HEADERS),
         )
+        if self._is_auth_proxy_config_published(auth_proxy_config):
+            logger.debug("Auth proxy configuration already published.")
+            return
         self.auth_proxy.update_auth_proxy_config(auth_proxy_config=auth_proxy_config)
 
+    def _is_auth_proxy_config_published(self, auth_proxy_config: AuthProxyConfig) -> bool:
+        """Check whether the auth-proxy relation already holds the configuration.
+
+        The library writes every key of the configuration on update, each one being a
+        relation-set call, so unchanged configurations are not handed over to it.
+
+        Args:
+            auth_proxy_config: the auth proxy configuration to publish.
+
+        Returns:
+            True if the application databag already holds the configuration, False otherwise.
+        """
+        relation = self.model.get_relation(AUTH_PROXY_RELATION)
+        # Only the leader can read the application databag, the library skips other units.
+        if not relation or not self.charm.unit.is_leader():
+            return False
+        app_data = relation.data[self.model.app]
+        return all(
+            app_data.get(key) == json.dumps(value)
+            for key, value in auth_proxy_config.to_dict().items()
+        )
+
     def _auth_proxy_relation_departed(self, event: ops.RelationDepartedEvent) -> None:
         """Unconfigure the auth proxy.
 
@@ -126,7 +149,7 @@ class Observer(ops.Object):
             event: The event fired.
         """
         if self.state.auth_proxy_integrated:
-            self._update_auth_proxy_config()
+            self._update_auth_proxy_config(self.ingress.url)
         self._replan_jenkins(event, self.state.auth_proxy_integrated)
 
     def _ingress_on_revoked(self, event: IngressPerAppRevokedEvent) -> None:
@@ -139,5 +162,5 @@ class Observer(ops.Object):
         # That the prefix has changed during charm-init
         self.jenkins.update_prefix("")
         if self.state.auth_proxy_integrated:
-            self._update_auth_proxy_config()
+            self._update_auth_proxy_config(self.ingress.url)
         self._replan_jenkins(event, self.state.auth_proxy_integrated)
@@ -98,7 +98,7 @@ class JenkinsK8sOperatorCharm(ops.CharmBase):
             JenkinsError: if there was an error fetching Jenkins version.
         """
         container = self.unit.get_container(JENKINS_SERVICE_NAME)
-        if not jenkins.is_storage_ready(container):
+        if not self.jenkins.is_storage_ready(container):
             self.unit.status = ops.WaitingStatus("Waiting for container/storage.")
             event.defer()  # Jenkins installation should be retried until preconditions are met.
             return
@@ -143,7 +143,7 @@ class JenkinsK8sOperatorCharm(ops.CharmBase):
         2. Update Jenkins patch version if available and is within restart-time-range config value.
         """
         container = self.unit.get_container(JENKINS_SERVICE_NAME)
-        if not jenkins.is_storage_ready(container):
+        if not self.jenkins.is_storage_ready(container):
             self.unit.status = ops.WaitingStatus("Waiting for container/storage.")
             return
 
@@ -169,7 +169,7 @@ class JenkinsK8sOperatorCharm(ops.CharmBase):
             event: The event fired when the charm is upgraded.
         """
         container = self.unit.get_container(JENKINS_SERVICE_NAME)
-        if not jenkins.is_storage_ready(container):
+        if not self.jenkins.is_storage_ready(container):
             self.jenkins_set_storage_config(event)
         # Update the agent discovery address.
         # Updating the secret is not required since it's calculated using the agent's node name.
@@ -157,6 +157,7 @@ class Jenkins:
         web_url: the Jenkins web URL.
         login_url: the Jenkins login URL.
         version: the Jenkins version.
+        replanned_with: the security setting and environment of the last replan in this hook.
     """
 
     environment: Environment
@@ -168,6 +169,14 @@ class Jenkins:
             environment: the Jenkins environment.
         """
         self.environment = environment
+        # Credentials read from the workload container, cached for the rest of the hook.
+        self._admin_credentials: Credentials | None = None
+        self._api_credentials: Credentials | None = None
+        # Authenticated API clients, dropped whenever the Jenkins sessions may have been reset.
+        self._clients: dict[Credentials, jenkinsapi.jenkins.Jenkins] = {}
+        self._storage_ready = False
+        self._version: str | None = None
+        self.replanned_with: tuple[bool, dict[str, str]] | None = None
 
     @property
     def web_url(self) -> str:
@@ -190,17 +199,38 @@ class Jenkins:
     def version(self) -> str:
         """Get the Jenkins server version.
 
+        The version of the installed Jenkins does not change during a hook, hence it is only
+        fetched from the server once.
+
         Raises:
             JenkinsError: if Jenkins is unreachable.
 
         Returns:
             The Jenkins server version.
         """
-        try:
-            return requests.get(self.web_url, timeout=10).headers["X-Jenkins"]
-        except (requests.exceptions.Timeout, requests.exceptions.ConnectionError) as exc:
-            logger.error("Failed to get Jenkins version, %s", exc)
-            raise JenkinsError("Failed to get Jenkins version.") from exc
+        if self._version is None:
+            try:
+                self._version = requests.get(self.web_url, timeout=10).headers["X-Jenkins"]
+            except (requests.exceptions.Timeout, requests.exceptions.ConnectionError) as exc:
+                logger.error("Failed to get Jenkins version, %s", exc)
+                raise JenkinsError("Failed to get Jenkins version.") from exc
+        return self._version
+
+    def is_storage_ready(self, container: ops.Container) -> bool:
+        """Return whether the Jenkins home directory is mounted and owned by jenkins.
+
+        Storage does not go away in the middle of a hook, so once the check passes it is not
+        repeated by the observers handling the remaining events.
+
+        Args:
+            container: The Jenkins workload container.
+
+        Returns:
+            True if home directory is mounted and owned by jenkins, False otherwise.
+        """
+        if not self._storage_ready:
+            self._storage_ready = is_storage_ready(container)
+        return self._storage_ready
 
     def update_prefix(self, prefix: str) -> None:
         """Update jenkins prefix.
@@ -224,15 +254,21 @@ class Jenkins:
     def wait_ready(self, timeout: int = 300, check_interval: int = 10) -> None:
         """Wait until Jenkins service is up.
 
+        The checks start one second apart and back off exponentially up to check_interval.
+
         Args:
-            timeout: Time in seconds to wait for jenkins to become ready in 10 second intervals.
-            check_interval: Time in seconds to wait between ready checks.
+            timeout: Time in seconds to wait for jenkins to become ready.
+            check_interval: Maximum time in seconds to wait between ready checks.
 
         Raises:
             TimeoutError: if Jenkins status check did not pass within the timeout duration.
         """
+        # Jenkins is waited on after every (re)start, which invalidates existing client sessions.
+        self._clients.clear()
         try:
-            _wait_for(self._is_ready, timeout=timeout, check_interval=check_interval)
+            _wait_for(
+                self._is_ready, timeout=timeout, check_interval=check_interval, initial_interval=1
+            )
         except TimeoutError as exc:
             raise TimeoutError("Timed out waiting for Jenkins to become ready.") from exc
 
@@ -266,21 +302,52 @@ class Jenkins:
         except (ops.pebble.PathError, JenkinsError) as exc:
             raise JenkinsBootstrapError("Failed to unlock wizard.") from exc
 
+    def _get_api_credentials(self, container: ops.Container) -> Credentials:
+        """Retrieve admin API credentials, reading them from the container only once.
+
+        Args:
+            container: The Jenkins workload container.
+
+        Returns:
+            Credentials: The Jenkins API Credentials.
+        """
+        if self._api_credentials is None:
+            self._api_credentials = _get_api_credentials(container)
+        return self._api_credentials
+
+    def _get_admin_credentials(self, container: ops.Container) -> Credentials:
+        """Retrieve admin credentials, reading them from the container only once.
+
+        Args:
+            container: The Jenkins workload container.
+
+        Returns:
+            The Jenkins admin account credentials.
+        """
+        if self._admin_credentials is None:
+            self._admin_credentials = get_admin_credentials(container)
+        return self._admin_credentials
+
     def _get_client(self, client_credentials: Credentials) -> jenkinsapi.jenkins.Jenkins:
         """Get the Jenkins client.
 
+        Constructing a client polls the Jenkins API, so the client is reused for the given
+        credentials until the Jenkins sessions are reset.
+
         Args:
             client_credentials: The credentials of a Jenkins user with access to the Jenkins API.
 
         Returns:
             The Jenkins client.
         """
-        return jenkinsapi.jenkins.Jenkins(
-            baseurl=self.web_url,
-            username=client_credentials.username,
-            password=client_credentials.password_or_token,
-            timeout=60,
-        )
+        if client_credentials not in self._clients:
+            self._clients[client_credentials] = jenkinsapi.jenkins.Jenkins(
+                baseurl=self.web_url,
+                username=client_credentials.username,
+                password=client_credentials.password_or_token,
+                timeout=60,
+            )
+        return self._clients[client_credentials]
 
     def _setup_user_token(self, container: ops.Container) -> None:
         """Configure admin user API token.
@@ -291,8 +358,9 @@ class Jenkins:
         Raises:
             JenkinsBootstrapError: if the token can not be setup.
         """
+        self._api_credentials = None
         try:
-            client = self._get_client(get_admin_credentials(container))
+            client = self._get_client(self._get_admin_credentials(container))
             token: str = client.generate_new_api_token(JUJU_API_TOKEN)
             container.push(API_TOKEN_PATH, token, user=USER, group=GROUP)
         except ops.pebble.PathError as exc:
@@ -342,7 +410,7 @@ class Jenkins:
         if not proxy_config:
             return
 
-        client = self._get_client(_get_api_credentials(container))
+        client = self._get_client(self._get_api_credentials(container))
         parsed_args = ", ".join(_get_groovy_proxy_args(proxy_config))
         script = f"proxy = new ProxyConfiguration({parsed_args})\nproxy.save()"
         try:
@@ -389,7 +457,7 @@ class Jenkins:
         Raises:
             JenkinsError: if an error occurred running groovy script getting the node secret.
         """
-        client = self._get_client(_get_api_credentials(container))
+        client = self._get_client(self._get_api_credentials(container))
         try:
             script = (
                 f"println(jenkins.model.Jenkins.getInstance()"
@@ -403,18 +471,17 @@ class Jenkins:
     def _get_node_config(
         self,
         agent_meta: state.AgentMeta,
-        container: ops.Container,
+        client: jenkinsapi.jenkins.Jenkins,
     ) -> dict[str, typing.Any]:
         """Get agent node configuration dictionary values.
 
         Args:
             agent_meta: The Jenkins agent metadata to create the node from.
-            container: The Jenkins workload container.
+            client: The API client used to communicate with the Jenkins server.
 
         Returns:
             A dictionary mapping of agent configuration values.
         """
-        client = self._get_client(_get_api_credentials(container))
         node = Node(
             jenkins_obj=client,
             baseurl=self.web_url,
@@ -444,9 +511,9 @@ class Jenkins:
         Raises:
             JenkinsError: if an error occurred running groovy script creating the node.
         """
-        client = self._get_client(_get_api_credentials(container))
+        client = self._get_client(self._get_api_credentials(container))
         try:
-            config = self._get_node_config(agent_meta=agent_meta, container=container)
+            config = self._get_node_config(agent_meta=agent_meta, client=client)
             client.create_node_with_config(name=agent_meta.name, config=config)
         except jenkinsapi.custom_exceptions.AlreadyExists:
             pass
@@ -464,9 +531,12 @@ class Jenkins:
         Raises:
             JenkinsError: if an error occurred running groovy script removing the node.
         """
-        client = self._get_client(_get_api_credentials(container))
+        client = self._get_client(self._get_api_credentials(container))
         try:
             client.delete_node(nodename=agent_name)
+        except jenkinsapi.custom_exceptions.UnknownNode:
+            # The node was removed by an earlier run of the departed hook.
+            logger.debug("Agent node %s already removed", agent_name)
         except jenkinsapi.custom_exceptions.JenkinsAPIException as exc:
             logger.error("Failed to delete agent node, %s", exc)
             raise JenkinsError("Failed to delete agent node.") from exc
@@ -511,7 +581,7 @@ class Jenkins:
         Raises:
             JenkinsError: if there was an API error calling safe restart.
         """
-        client = self._get_client(_get_api_credentials(container))
+        client = self._get_client(self._get_api_credentials(container))
         try:
             # Workaround for https://github.com/pycontribs/jenkinsapi/issues/844
             client.safe_restart(wait_for_reboot=False)
@@ -531,13 +601,14 @@ class Jenkins:
         Args:
             container: The workload container.
         """
-        client = self._get_client(get_admin_credentials(container))
+        client = self._get_client(self._get_admin_credentials(container))
         client.run_groovy_script(
             """
     import net.bull.javamelody.*;
     def sess = SessionListener.newInstance();
     sess.invalidateAllSessions();"""
         )
+        self._clients.clear()
 
     # This groovy script is tested in integration test.
     def _set_new_password(
@@ -549,7 +620,7 @@ class Jenkins:
             container: The workload container
             new_password: New password to set for admin user.
         """
-        client = self._get_client(get_admin_credentials(container))
+        client = self._get_client(self._get_admin_credentials(container))
         client.run_groovy_script(
             'User.getById("admin",false).addProperty(hudson.security.'
             "HudsonPrivateSecurityRealm.Details"
@@ -582,6 +653,7 @@ class Jenkins:
             user=USER,
             group=GROUP,
         )
+        self._admin_credentials = Credentials(username="admin", password_or_token=new_password)
         return new_password
 
     def remove_unlisted_plugins(
@@ -607,7 +679,7 @@ class Jenkins:
         except TimeoutError as exc:
             raise JenkinsPluginError("Plugins currently being installed.") from exc
 
-        client = self._get_client(_get_api_credentials(container))
+        client = self._get_client(self._get_api_credentials(container))
         res = client.run_groovy_script(
             """
     def plugins = jenkins.model.Jenkins.instance.getPluginManager().getPlugins()
@@ -648,25 +720,38 @@ class Jenkins:
 
 
 def _wait_for(
-    func: typing.Callable[[], typing.Any], timeout: int = 300, check_interval: int = 10
+    func: typing.Callable[[], typing.Any],
+    timeout: int = 300,
+    check_interval: int = 10,
+    initial_interval: int | None = None,
 ) -> None:
     """Wait for function execution to become truthy.
 
+    If initial_interval is given, the checks start initial_interval seconds apart and back off
+    exponentially up to check_interval, so that a function becoming truthy shortly after the
+    first check is noticed early.
+
     Args:
         func: A callback function to wait to return a truthy value.
         timeout: Time in seconds to wait for function result to become truthy.
-        check_interval: Time in seconds to wait between ready checks.
+        check_interval: Time in seconds to wait between ready checks, the maximum one if
+            initial_interval is given.
+        initial_interval: Time in seconds to wait after the first check, doubled after each one.
 
     Raises:
         TimeoutError: if the callback function did not return a truthy value within timeout.
     """
     start_time = now = datetime.now()
     min_wait_seconds = timedelta(seconds=timeout)
+    interval = check_interval
+    if initial_interval is not None:
+        interval = min(initial_interval, check_interval)
     while now - start_time < min_wait_seconds:
         if func():
             break
         now = datetime.now()
-        sleep(check_interval)
+        sleep(interval)
+        interval = min(interval * 2, check_interval)
     else:
         if func():
             return
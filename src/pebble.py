@@ -16,6 +16,14 @@ if typing.TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# The Jenkins service command, only the prefix argument varies between layers.
+JENKINS_COMMAND = (
+    f"java -D{jenkins.SYSTEM_PROPERTY_HEADLESS} "
+    f"-D{jenkins.SYSTEM_PROPERTY_LOGGING} "
+    "-XX:MaxRAMPercentage=50.0 -XX:InitialRAMPercentage=50.0 "
+    f"-jar {jenkins.EXECUTABLES_PATH}/jenkins.war"
+)
+
 
 def replan_jenkins(
     container: ops.Container,
@@ -34,6 +42,14 @@ def replan_jenkins(
     Raises:
         JenkinsBootstrapError: if an error occurs while bootstrapping Jenkins.
     """
+    # TypedDict and Dict[str,str] are not compatible.
+    env_dict = typing.cast(typing.Dict[str, str], jenkins_instance.environment)
+    # Several events handled in the same hook, e.g. re-emitted deferred events, can request
+    # the same replan. Each one restarts Jenkins, so identical ones are only applied once.
+    replan_with = (disable_security, dict(env_dict))
+    if replan_with == jenkins_instance.replanned_with:
+        logger.debug("Jenkins already replanned with the same configuration.")
+        return
     jenkins.install_logging_config(container=container)
     container.add_layer("jenkins", _get_pebble_layer(jenkins_instance), combine=True)
     container.replan()
@@ -57,6 +73,7 @@ def replan_jenkins(
     except jenkins.JenkinsBootstrapError as exc:
         logger.error("Error installing Jenkins, %s", exc)
         raise
+    jenkins_instance.replanned_with = replan_with
 
 
 def _get_pebble_layer(jenkins_instance: jenkins.Jenkins) -> ops.pebble.Layer:
@@ -77,11 +94,7 @@ def _get_pebble_layer(jenkins_instance: jenkins.Jenkins) -> ops.pebble.Layer:
             JENKINS_SERVICE_NAME: {
                 "override": "replace",
                 "summary": "jenkins",
-                "command": f"java -D{jenkins.SYSTEM_PROPERTY_HEADLESS} "
-                f"-D{jenkins.SYSTEM_PROPERTY_LOGGING} "
-                "-XX:MaxRAMPercentage=50.0 -XX:InitialRAMPercentage=50.0 "
-                f"-jar {jenkins.EXECUTABLES_PATH}/jenkins.war "
-                f"--prefix={env_dict['JENKINS_PREFIX']}",
+                "command": f"{JENKINS_COMMAND} --prefix={env_dict['JENKINS_PREFIX']}",
                 "startup": "enabled",
                 "environment": env_dict,
                 "user": jenkins.USER,
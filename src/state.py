@@ -139,6 +139,15 @@ class AgentMeta(BaseModel):
         return cls(executors=num_executors, labels=labels, name=name)
 
 
+# The agent name is set under a different key in each agent relation.
+_AGENT_META_PARSERS: typing.Mapping[
+    str, typing.Callable[[ops.RelationDataContent], typing.Optional[AgentMeta]]
+] = {
+    AGENT_RELATION: AgentMeta.from_agent_relation,
+    DEPRECATED_AGENT_RELATION: AgentMeta.from_deprecated_agent_relation,
+}
+
+
 def _is_remote_unit(app_name: str, unit: ops.Unit) -> bool:
     """Return whether the unit is a remote unit in a relation.
 
@@ -169,19 +178,9 @@ def _get_agent_meta_map_from_relation(
     unit_metadata_mapping = {}
     for relation in relations:
         remote_units = filter(functools.partial(_is_remote_unit, current_app_name), relation.units)
-        if relation.name == DEPRECATED_AGENT_RELATION:
-            unit_metadata_mapping.update(
-                {
-                    unit.name: AgentMeta.from_deprecated_agent_relation(relation.data[unit])
-                    for unit in remote_units
-                }
-            )
-            continue
+        from_relation_data = _AGENT_META_PARSERS[relation.name]
         unit_metadata_mapping.update(
-            {
-                unit.name: AgentMeta.from_agent_relation(relation.data[unit])
-                for unit in remote_units
-            }
+            {unit.name: from_relation_data(relation.data[unit]) for unit in remote_units}
         )
     return unit_metadata_mapping
 
@@ -379,6 +379,24 @@ def test_agent_discovery_url_fqdn_fallback(harness: Harness, monkeypatch: pytest
     )
 
 
+def test_agent_discovery_url_fqdn_resolved_once(harness: Harness, monkeypatch: pytest.MonkeyPatch):
+    """
+    arrange: given a base jenkins charm with no ingress and an invalid ip.
+    act: access the charm's agent_discovery_url property twice.
+    assert: the fqdn is only resolved once.
+    """
+    harness.begin()
+    getfqdn_mock = MagicMock(return_value="test")
+    monkeypatch.setattr(socket, "getfqdn", getfqdn_mock)
+    monkeypatch.setattr(ipaddress, "ip_address", MagicMock(side_effect=ValueError))
+
+    first = harness.charm.agent_observer.agent_discovery_url
+    second = harness.charm.agent_observer.agent_discovery_url
+
+    assert first == second == f"http://test:{jenkins.WEB_PORT}"
+    getfqdn_mock.assert_called_once()
+
+
 def test_agent_discovery_url_model_error_null_binding(
     harness: Harness, monkeypatch: pytest.MonkeyPatch
 ):
@@ -533,3 +551,31 @@ def test_reconfigure_agent_discovery_url_unchanged(
     assert (
         harness.get_relation_data(relation_id, harness.model.unit.name)["url"] == mock_ingress_url
     )
+
+
+def test_reconfigure_agent_discovery_url_resolved_once(
+    harness: Harness,
+    get_relation_data: Callable[[str], dict[str, str]],
+):
+    """
+    arrange: given a base jenkins charm integrated with two jenkins-agent applications.
+    act: reconfigure the agent discovery url.
+    assert: the discovery url is resolved once and set in both integration databags.
+    """
+    relation_ids = [
+        harness.add_relation(
+            state.AGENT_RELATION, app, unit_data=get_relation_data(state.AGENT_RELATION)
+        )
+        for app in ("jenkins-agent", "jenkins-agent-two")
+    ]
+    harness.begin()
+    mock_url = "http://agent-discovery.test"
+
+    with patch(
+        "agent.Observer.agent_discovery_url", new_callable=PropertyMock, return_value=mock_url
+    ) as url_mock:
+        harness.charm.agent_observer.reconfigure_agent_discovery(MagicMock())
+
+    url_mock.assert_called_once()
+    for relation_id in relation_ids:
+        assert harness.get_relation_data(relation_id, harness.model.unit.name)["url"] == mock_url
@@ -5,7 +5,7 @@
 
 # pylint:disable=protected-access
 
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, PropertyMock, patch
 
 import ops
 from charms.oathkeeper.v0.auth_proxy import AuthProxyRequirer
@@ -49,23 +49,26 @@ def test_on_auth_proxy_relation_joined_when_ingress_not_ready(_):
 
 @patch("jenkins.is_storage_ready", return_value=True)
 @patch("pebble.replan_jenkins")
-def test_on_auth_proxy_relation_joined(replan_mock, _):
+def test_on_auth_proxy_relation_joined(replan_mock, storage_ready_mock):
     """
     arrange: given a charm with ready storage and ingress related.
     act: when auth_proxy relation joined event is fired.
-    assert: the pebble service is replaned.
+    assert: the pebble service is replaned, the storage is probed and the ingress URL read once.
     """
     harness = Harness(JenkinsK8sOperatorCharm)
     harness.begin()
     harness.set_can_connect(harness.model.unit.containers["jenkins"], True)
     mock_event = MagicMock(spec=ops.RelationCreatedEvent)
     mock_ingress = MagicMock(spec=IngressPerAppRequirer)
-    mock_ingress.url.return_value = "https://example.com"
+    url_mock = PropertyMock(return_value="https://example.com")
+    type(mock_ingress).url = url_mock
     harness.charm.auth_proxy_observer.ingress = mock_ingress
     harness.charm.auth_proxy_observer.auth_proxy = MagicMock(spec=AuthProxyRequirer)
     harness.charm.auth_proxy_observer._on_auth_proxy_relation_joined(mock_event)
 
     replan_mock.assert_called_once()
+    storage_ready_mock.assert_called_once()
+    url_mock.assert_called_once()
 
 
 @patch("jenkins.is_storage_ready", return_value=False)
@@ -99,3 +102,27 @@ def test_auth_proxy_relation_departed(replan_mock, _):
     harness.charm.auth_proxy_observer._auth_proxy_relation_departed(mock_event)
 
     replan_mock.assert_called_once()
+
+
+def test_update_auth_proxy_config_unchanged():
+    """
+    arrange: given a leader charm related to oathkeeper.
+    act: when the auth proxy config is updated twice with the same ingress url.
+    assert: the auth-proxy databag is only written the first time.
+    """
+    harness = Harness(JenkinsK8sOperatorCharm)
+    harness.set_leader(True)
+    harness.add_relation("auth-proxy", "oathkeeper")
+    harness.begin()
+
+    with patch.object(
+        harness._backend,
+        "update_relation_data",
+        wraps=harness._backend.update_relation_data,
+    ) as update_mock:
+        harness.charm.auth_proxy_observer._update_auth_proxy_config("https://example.com")
+        written = update_mock.call_count
+        harness.charm.auth_proxy_observer._update_auth_proxy_config("https://example.com")
+
+    assert written
+    assert update_mock.call_count == written
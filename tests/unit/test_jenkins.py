@@ -126,6 +126,45 @@ def test_wait_ready(
     jenkins.Jenkins(mock_env).wait_ready(1, 1)
 
 
+def test_wait_ready_backoff(
+    monkeypatch: pytest.MonkeyPatch,
+    mocked_get_request: typing.Callable[..., requests.Response],
+    mock_env: jenkins.Environment,
+):
+    """
+    arrange: given mocked requests that return a 200 response on the fifth check.
+    act: wait for jenkins to become ready.
+    assert: the interval between checks doubles until it reaches check_interval.
+    """
+    responses = iter([503, 503, 503, 503, 200])
+    monkeypatch.setattr(
+        requests,
+        "get",
+        lambda *args, **kwargs: mocked_get_request(*args, status_code=next(responses), **kwargs),
+    )
+    mock_sleep = MagicMock()
+    monkeypatch.setattr(jenkins, "sleep", mock_sleep)
+
+    jenkins.Jenkins(mock_env).wait_ready(300, 5)
+
+    assert [call.args[0] for call in mock_sleep.call_args_list] == [1, 2, 4, 5]
+
+
+def test__wait_for_fixed_interval(monkeypatch: pytest.MonkeyPatch):
+    """
+    arrange: given a function that returns a truthy value on the fourth check.
+    act: wait for the function without an initial interval.
+    assert: the checks are check_interval seconds apart.
+    """
+    results = iter([False, False, False, True])
+    mock_sleep = MagicMock()
+    monkeypatch.setattr(jenkins, "sleep", mock_sleep)
+
+    jenkins._wait_for(lambda: next(results), timeout=300, check_interval=5)
+
+    assert [call.args[0] for call in mock_sleep.call_args_list] == [5, 5, 5]
+
+
 def test_is_storage_ready_no_container():
     """
     arrange: nothing.
@@ -175,6 +214,22 @@ def test_is_storage_ready_proc_error():
         jenkins.is_storage_ready(container=mock_container)
 
 
+def test_jenkins_is_storage_ready_cached(mock_env: jenkins.Environment):
+    """
+    arrange: given a Jenkins instance and storage that is not ready, then ready.
+    act: when storage readiness is checked three times.
+    assert: the storage is probed until it is ready and not probed afterwards.
+    """
+    jenkins_instance = jenkins.Jenkins(mock_env)
+    mock_container = MagicMock(ops.Container)
+
+    with patch("jenkins.is_storage_ready", side_effect=[False, True]) as storage_ready_mock:
+        results = [jenkins_instance.is_storage_ready(mock_container) for _ in range(3)]
+
+    assert results == [False, True, True]
+    assert storage_ready_mock.call_count == 2
+
+
 def test_get_admin_credentials(
     harness_container: HarnessWithContainer, admin_credentials: jenkins.Credentials
 ):
@@ -211,6 +266,55 @@ def test__get_api_credentials(
     assert jenkins._get_api_credentials(harness_container.container) == admin_credentials
 
 
+def test_jenkins__get_api_credentials_cached(
+    harness_container: HarnessWithContainer,
+    admin_credentials: jenkins.Credentials,
+    mock_env: jenkins.Environment,
+):
+    """
+    arrange: given a Jenkins instance and a container with the admin api token file.
+    act: when the API credentials are fetched twice.
+    assert: the token file is only read from the container once.
+    """
+    jenkins_instance = jenkins.Jenkins(mock_env)
+
+    with patch.object(
+        harness_container.container, "pull", wraps=harness_container.container.pull
+    ) as pull_mock:
+        first = jenkins_instance._get_api_credentials(harness_container.container)
+        second = jenkins_instance._get_api_credentials(harness_container.container)
+
+    assert first == second == admin_credentials
+    pull_mock.assert_called_once()
+
+
+def test_jenkins__get_admin_credentials_cached(
+    harness_container: HarnessWithContainer, mock_env: jenkins.Environment
+):
+    """
+    arrange: given a Jenkins instance and a container with the admin password file.
+    act: when the admin credentials are fetched twice, then the credentials are rotated.
+    assert: the password file is only read once and the rotated password is used afterwards.
+    """
+    jenkins_instance = jenkins.Jenkins(mock_env)
+
+    with (
+        patch.object(
+            harness_container.container, "pull", wraps=harness_container.container.pull
+        ) as pull_mock,
+        patch.object(jenkins.Jenkins, "_invalidate_sessions"),
+        patch.object(jenkins.Jenkins, "_set_new_password"),
+    ):
+        first = jenkins_instance._get_admin_credentials(harness_container.container)
+        second = jenkins_instance._get_admin_credentials(harness_container.container)
+        new_password = jenkins_instance.rotate_credentials(harness_container.container)
+        rotated = jenkins_instance._get_admin_credentials(harness_container.container)
+
+    assert first == second
+    assert rotated.password_or_token == new_password
+    pull_mock.assert_called_once()
+
+
 def test__setup_user_token(harness_container: HarnessWithContainer, mock_env: jenkins.Environment):
     """
     arrange: given a mocked container and a monkeypatched mocked jenkinsapi client.
@@ -370,6 +474,28 @@ def test_version(
     assert jenkins.Jenkins(mock_env).version == jenkins_version
 
 
+def test_version_cached(
+    monkeypatch: pytest.MonkeyPatch,
+    mocked_get_request: typing.Callable[..., requests.Response],
+    jenkins_version: str,
+    mock_env: jenkins.Environment,
+):
+    """
+    arrange: given a monkeypatched request that returns Jenkins version in headers.
+    act: when the Jenkins version is read twice.
+    assert: the request is only sent to the Jenkins server once.
+    """
+    get_mock = MagicMock(side_effect=partial(mocked_get_request, status_code=200))
+    monkeypatch.setattr(requests, "get", get_mock)
+    jenkins_instance = jenkins.Jenkins(mock_env)
+
+    first = jenkins_instance.version
+    second = jenkins_instance.version
+
+    assert first == second == jenkins_version
+    get_mock.assert_called_once()
+
+
 def test__unlock_wizard(
     harness_container: HarnessWithContainer,
     mocked_get_request: typing.Callable[..., requests.Response],
@@ -796,6 +922,30 @@ def test_get_client(admin_credentials: jenkins.Credentials, mock_env: jenkins.En
         )
 
 
+def test_get_client_cached(
+    monkeypatch: pytest.MonkeyPatch,
+    mocked_get_request: typing.Callable[..., requests.Response],
+    admin_credentials: jenkins.Credentials,
+    mock_env: jenkins.Environment,
+):
+    """
+    arrange: given a Jenkins instance.
+    act: when get_client is called twice, then again after waiting for Jenkins to be ready.
+    assert: the client is reused until Jenkins has been waited on.
+    """
+    monkeypatch.setattr(requests, "get", partial(mocked_get_request, status_code=200))
+
+    with patch("jenkinsapi.jenkins.Jenkins", side_effect=lambda **_: MagicMock()):
+        jenkins_instance = jenkins.Jenkins(mock_env)
+        client = jenkins_instance._get_client(admin_credentials)
+        cached_client = jenkins_instance._get_client(admin_credentials)
+        jenkins_instance.wait_ready(1, 1)
+        new_client = jenkins_instance._get_client(admin_credentials)
+
+        assert cached_client is client
+        assert new_client is not client
+
+
 def test_get_node_secret_api_error(
     container: ops.Container, mock_client: MagicMock, mock_env: jenkins.Environment
 ):
@@ -870,6 +1020,27 @@ def test_add_agent_node_already_exists(
         )
 
 
+@pytest.mark.usefixtures("patch_jenkins_node")
+def test_add_agent_node_single_client(
+    container: ops.Container, mock_client: MagicMock, mock_env: jenkins.Environment
+):
+    """
+    arrange: given a mocked jenkins client.
+    act: when add_agent is called.
+    assert: a single client is used to build the node config and create the node.
+    """
+    with patch.object(jenkins.Jenkins, "_get_client") as get_client_mock:
+        get_client_mock.return_value = mock_client
+
+        jenkins.Jenkins(mock_env).add_agent_node(
+            state.AgentMeta(executors="3", labels="x86_64", name="agent_node_0"),
+            container,
+        )
+
+    get_client_mock.assert_called_once()
+    mock_client.create_node_with_config.assert_called_once()
+
+
 @pytest.mark.usefixtures("patch_jenkins_node")
 def test_add_agent_node(
     container: ops.Container, mock_client: MagicMock, mock_env: jenkins.Environment
@@ -925,6 +1096,23 @@ def test_remove_agent_node_fail(
             jenkins.Jenkins(mock_env).remove_agent_node("jekins-agent-0", container)
 
 
+def test_remove_agent_node_unknown(
+    container: ops.Container, mock_client: MagicMock, mock_env: jenkins.Environment
+):
+    """
+    arrange: given a mocked jenkins client that does not know the agent node.
+    act: when remove_agent_node is called.
+    assert: no exception is raised.
+    """
+    mock_client.delete_node.side_effect = jenkinsapi.custom_exceptions.UnknownNode
+    with patch.object(jenkins.Jenkins, "_get_client") as get_client_mock:
+        get_client_mock.return_value = mock_client
+
+        jenkins.Jenkins(mock_env).remove_agent_node("jekins-agent-0", container)
+
+    mock_client.delete_node.assert_called_once()
+
+
 def test_remove_agent_node(
     container: ops.Container, mock_client: MagicMock, mock_env: jenkins.Environment
 ):
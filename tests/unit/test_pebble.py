@@ -73,3 +73,30 @@ def test_replan_jenkins_when_not_ready(harness_container: HarnessWithContainer):
                 jenkins.Jenkins(env),
                 state.State.from_charm(harness.charm),
             )
+
+
+def test_replan_jenkins_deduplicated(harness_container: HarnessWithContainer):
+    """
+    arrange: given a Jenkins instance.
+    act: when Jenkins is replanned with security disabled, enabled, then disabled twice.
+    assert: Jenkins is only bootstrapped again when the settings differ from the last replan.
+    """
+    harness = harness_container.harness
+    harness.begin()
+    env = jenkins.Environment(
+        JENKINS_HOME=str(jenkins.JENKINS_HOME_PATH),
+        JENKINS_PREFIX="/",
+    )
+    jenkins_instance = jenkins.Jenkins(env)
+    charm_state = state.State.from_charm(harness.charm)
+
+    with (
+        patch.object(jenkins.Jenkins, "wait_ready"),
+        patch.object(jenkins.Jenkins, "bootstrap") as bootstrap_mock,
+    ):
+        for disable_security in (True, False, True, True):
+            pebble.replan_jenkins(
+                harness_container.container, jenkins_instance, charm_state, disable_security
+            )
+
+    assert bootstrap_mock.call_count == 3